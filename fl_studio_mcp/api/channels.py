@@ -4,10 +4,14 @@ FL Studio Channels API wrapper.
 Provides control over channel rack, instruments, and channels.
 """
 
-from typing import Dict, List, Any
+import time
+from array import array
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
 from fl_studio_mcp.core.bridge import FLStudioBridge
+from fl_studio_mcp.core.cache import TTLCache
 from fl_studio_mcp.core.exceptions import FLStudioMCPError
+from fl_studio_mcp.core.opcodes import OpCode
 
 
 class ChannelAPI:
@@ -18,14 +22,72 @@ class ChannelAPI:
     channel selection, and channel properties.
     """
 
-    def __init__(self, bridge: FLStudioBridge):
+    def __init__(
+        self,
+        bridge: FLStudioBridge,
+        cache_ttl: float = 5.0,
+        structure_check_interval: float = 1.0,
+    ):
         """
         Initialize channel API.
 
         Args:
             bridge: FLStudioBridge instance
+            cache_ttl: Seconds to cache rarely-changing channel properties
+            structure_check_interval: Seconds between channel count checks
+                used to detect added/removed channels
         """
         self.bridge = bridge
+        self._cache = TTLCache(cache_ttl)
+        self._structure_check_interval = structure_check_interval
+        self._last_structure_check = 0.0
+        self._known_count: Optional[int] = None
+
+    def invalidate(self, channel_id: Optional[int] = None) -> None:
+        """
+        Drop cached channel properties.
+
+        Args:
+            channel_id: Channel index to invalidate (all channels if None)
+        """
+        if channel_id is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda key: key[0] == channel_id)
+
+    def _check_structure(self) -> None:
+        """Invalidate the cache if the channel count changed since the last check."""
+        now = time.monotonic()
+        if now - self._last_structure_check < self._structure_check_interval:
+            return
+
+        self._last_structure_check = now
+        count = self.get_count()
+        if count != self._known_count:
+            self._known_count = count
+            self._cache.invalidate()
+
+    def _cached_execute(self, channel_id: int, field: str, code: str) -> dict:
+        """
+        Execute a property read, serving it from the cache when possible.
+
+        Args:
+            channel_id: Channel index
+            field: Property name, used as part of the cache key
+            code: Python code that reads the property
+
+        Returns:
+            safe_execute result dictionary
+        """
+        self._check_structure()
+
+        key = (channel_id, field)
+        result = self._cache.get(key)
+        if result is None:
+            result = self.bridge.safe_execute(code)
+            if result.get("success"):
+                self._cache.set(key, result)
+        return result
 
     def get_count(self) -> int:
         """
@@ -51,8 +113,8 @@ class ChannelAPI:
         Returns:
             Channel name
         """
-        result = self.bridge.safe_execute(
-            f'channels.getChannelName({channel_id})'
+        result = self._cached_execute(
+            channel_id, "name", f'channels.getChannelName({channel_id})'
         )
         if result.get("success"):
             return str(result.get("data", f"Channel {channel_id}"))
@@ -69,9 +131,8 @@ class ChannelAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f'channels.setChannelName({channel_id}, "{name}")'
-        )
+        result = self.bridge.safe_call(OpCode.SET_CHANNEL_NAME, channel_id, name)
+        self._cache.pop((channel_id, "name"))
         return result.get("success", False)
 
     def get_color(self, channel_id: int) -> str:
@@ -84,8 +145,8 @@ class ChannelAPI:
         Returns:
             Color as hex string (e.g., "#FF5733")
         """
-        result = self.bridge.safe_execute(
-            f"channels.getChannelColor({channel_id})"
+        result = self._cached_execute(
+            channel_id, "color", f"channels.getChannelColor({channel_id})"
         )
         if result.get("success"):
             color_int = result.get("data", 0)
@@ -107,9 +168,8 @@ class ChannelAPI:
         # Remove # if present and convert to int
         color_int = int(color_hex.lstrip("#"), 16)
 
-        result = self.bridge.safe_execute(
-            f"channels.setChannelColor({channel_id}, {color_int})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_CHANNEL_COLOR, channel_id, color_int)
+        self._cache.pop((channel_id, "color"))
         return result.get("success", False)
 
     def select(self, channel_id: int) -> bool:
@@ -122,11 +182,30 @@ class ChannelAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"channels.selectChannel({channel_id})"
-        )
+        result = self.bridge.safe_call(OpCode.SELECT_CHANNEL, channel_id)
         return result.get("success", False)
 
+    def select_and_describe(self, channel_id: int) -> Tuple[bool, str]:
+        """
+        Select a channel and get its name in one round-trip.
+
+        Args:
+            channel_id: Channel index
+
+        Returns:
+            Tuple of (success, channel name)
+        """
+        result = self.bridge.safe_eval_tuple(
+            f"(channels.selectChannel({channel_id}), channels.getChannelName({channel_id}))",
+            2,
+        )
+        if not result.get("success"):
+            return False, f"Channel {channel_id}"
+
+        name = str(result["data"][1])
+        self._cache.set((channel_id, "name"), {"success": True, "data": name})
+        return True, name
+
     def get_selected(self) -> int:
         """
         Get the currently selected channel index.
@@ -148,19 +227,107 @@ class ChannelAPI:
         Returns:
             List of channel information dictionaries
         """
-        count = self.get_count()
-        channels = []
+        return self._get_rows(0, "channels.channelCount()")
+
+    def get_range(self, start: int, count: int) -> List[Dict[str, Any]]:
+        """
+        Get information about a range of channels.
 
-        for i in range(count):
-            channel_info = {
+        Only the requested channels are read and sent back, so showing
+        the first few channels of a large project stays cheap.
+
+        Args:
+            start: Index of the first channel
+            count: Maximum number of channels to return
+
+        Returns:
+            List of channel information dictionaries (shorter than count
+            if the range runs past the last channel)
+        """
+        return self._get_rows(start, f"min({start + count}, channels.channelCount())")
+
+    def _get_rows(self, start: int, stop: str) -> List[Dict[str, Any]]:
+        """
+        Read channel rows from start up to a stop expression evaluated in FL Studio.
+
+        Args:
+            start: Index of the first channel
+            stop: Expression for the index after the last channel
+
+        Returns:
+            List of channel information dictionaries
+        """
+        # Build every row inside FL Studio so the whole scan is one round-trip
+        result = self.bridge.safe_execute_many(
+            "[(channels.getChannelName(i), channels.getChannelColor(i), i == selected) "
+            "for selected in (channels.selectedChannel(),) "
+            f"for i in range({start}, {stop})]"
+        )
+        if not result.get("success"):
+            return []
+
+        return [
+            {
                 "id": i,
-                "name": self.get_name(i),
-                "color": self.get_color(i),
-                "selected": (i == self.get_selected()),
+                "name": str(name),
+                "color": f"#{color:06X}",
+                "selected": selected,
             }
-            channels.append(channel_info)
+            for i, (name, color, selected) in enumerate(result["data"], start)
+        ]
 
-        return channels
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all channel properties in column form.
+
+        The properties are read as parallel arrays in a single round-trip.
+        Numeric columns are compact ``array.array`` buffers, which can be
+        wrapped without copying (e.g. ``numpy.frombuffer(colors, "i8")``).
+
+        Returns:
+            Dictionary with "ids" and "colors" (int arrays), "names"
+            (list of str) and "selected" (selected channel index, or -1)
+        """
+        result = self.bridge.safe_eval_tuple(
+            "(lambda count: ("
+            "channels.selectedChannel(), "
+            "[channels.getChannelName(i) for i in range(count)], "
+            "[channels.getChannelColor(i) for i in range(count)]"
+            "))(channels.channelCount())",
+            3,
+        )
+
+        selected, names, colors = -1, [], []
+        if result.get("success"):
+            selected, names, colors = result["data"]
+
+        return {
+            "ids": array("i", range(len(names))),
+            "names": [str(name) for name in names],
+            "colors": array("q", colors),
+            "selected": int(selected),
+        }
+
+    def get_all_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get information about all channels in column form.
+
+        Same data as get_all(), as one list per field (row i of every
+        column describes channel i) instead of one dictionary per channel.
+
+        Returns:
+            Dictionary with "ids", "names", "colors" (hex strings) and
+            "selected" (bools) lists
+        """
+        snapshot = self.snapshot()
+        selected = snapshot["selected"]
+
+        return {
+            "ids": snapshot["ids"].tolist(),
+            "names": snapshot["names"],
+            "colors": [f"#{color:06X}" for color in snapshot["colors"]],
+            "selected": [i == selected for i in snapshot["ids"]],
+        }
 
     def create_channel(self, name: str, color: str = None) -> Dict[str, Any]:
         """
@@ -205,8 +372,45 @@ class ChannelAPI:
             True if successful
         """
         # FL Studio API for adding notes
-        result = self.bridge.safe_execute(
-            f"channels.addNote({channel_id}, {position}, {key}, {duration}, {velocity})"
+        result = self.bridge.safe_call(
+            OpCode.ADD_NOTE, channel_id, position, key, duration, velocity
+        )
+        return result.get("success", False)
+
+    def set_piano_roll_notes(
+        self,
+        channel_id: int,
+        positions: Sequence[float],
+        keys: Sequence[int],
+        durations: Sequence[float],
+        velocities: Sequence[int],
+    ) -> bool:
+        """
+        Add several notes to the piano roll in one round-trip.
+
+        Notes are given in column form: index i of every sequence
+        describes the same note.
+
+        Args:
+            channel_id: Channel index
+            positions: Note positions in beats
+            keys: MIDI keys (0-127)
+            durations: Note durations in beats
+            velocities: Note velocities (0-127)
+
+        Returns:
+            True if every note was added
+        """
+        if len(positions) == 1:
+            return self.set_piano_roll_note(
+                channel_id, positions[0], keys[0], durations[0], velocities[0]
+            )
+
+        # Pass the columns as tuple literals and add every note in one expression
+        result = self.bridge.safe_execute_many(
+            f"[channels.addNote({channel_id}, p, k, d, v) for p, k, d, v in zip("
+            f"{tuple(positions)!r}, {tuple(keys)!r}, "
+            f"{tuple(durations)!r}, {tuple(velocities)!r})]"
         )
         return result.get("success", False)
 
@@ -220,6 +424,7 @@ class ChannelAPI:
         Returns:
             MIDI channel number (0-15)
         """
+        # Not cached: MixerAPI.route_channel() changes this value
         result = self.bridge.safe_execute(
             f"channels.getTargetFxTrack({channel_id})"
         )
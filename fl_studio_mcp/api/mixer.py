@@ -4,10 +4,15 @@ FL Studio Mixer API wrapper.
 Provides control over mixer tracks, levels, and routing.
 """
 
-from typing import Dict, List, Any
+import time
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
 
 from fl_studio_mcp.core.bridge import FLStudioBridge
+from fl_studio_mcp.core.cache import TTLCache
 from fl_studio_mcp.core.exceptions import FLStudioMCPError
+from fl_studio_mcp.core.opcodes import OpCode
+from fl_studio_mcp.models.mixer import MixerLevel
 
 
 class MixerAPI:
@@ -18,14 +23,72 @@ class MixerAPI:
     pans, sends, and routing.
     """
 
-    def __init__(self, bridge: FLStudioBridge):
+    def __init__(
+        self,
+        bridge: FLStudioBridge,
+        cache_ttl: float = 5.0,
+        structure_check_interval: float = 1.0,
+    ):
         """
         Initialize mixer API.
 
         Args:
             bridge: FLStudioBridge instance
+            cache_ttl: Seconds to cache rarely-changing track properties
+            structure_check_interval: Seconds between track count checks
+                used to detect added/removed tracks
         """
         self.bridge = bridge
+        self._cache = TTLCache(cache_ttl)
+        self._structure_check_interval = structure_check_interval
+        self._last_structure_check = 0.0
+        self._known_count: Optional[int] = None
+
+    def invalidate(self, track_id: Optional[int] = None) -> None:
+        """
+        Drop cached track properties.
+
+        Args:
+            track_id: Mixer track index to invalidate (all tracks if None)
+        """
+        if track_id is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda key: key[0] == track_id)
+
+    def _check_structure(self) -> None:
+        """Invalidate the cache if the track count changed since the last check."""
+        now = time.monotonic()
+        if now - self._last_structure_check < self._structure_check_interval:
+            return
+
+        self._last_structure_check = now
+        count = self.get_track_count()
+        if count != self._known_count:
+            self._known_count = count
+            self._cache.invalidate()
+
+    def _cached_execute(self, track_id: int, field: str, code: str) -> dict:
+        """
+        Execute a property read, serving it from the cache when possible.
+
+        Args:
+            track_id: Mixer track index
+            field: Property name, used as part of the cache key
+            code: Python code that reads the property
+
+        Returns:
+            safe_execute result dictionary
+        """
+        self._check_structure()
+
+        key = (track_id, field)
+        result = self._cache.get(key)
+        if result is None:
+            result = self.bridge.safe_execute(code)
+            if result.get("success"):
+                self._cache.set(key, result)
+        return result
 
     def get_track_count(self) -> int:
         """
@@ -51,8 +114,8 @@ class MixerAPI:
         Returns:
             Track name
         """
-        result = self.bridge.safe_execute(
-            f'mixer.getTrackName({track_id})'
+        result = self._cached_execute(
+            track_id, "name", f'mixer.getTrackName({track_id})'
         )
         if result.get("success"):
             return str(result.get("data", f"Track {track_id}"))
@@ -69,9 +132,8 @@ class MixerAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f'mixer.setTrackName({track_id}, "{name}")'
-        )
+        result = self.bridge.safe_call(OpCode.SET_TRACK_NAME, track_id, name)
+        self._cache.pop((track_id, "name"))
         return result.get("success", False)
 
     def get_volume(self, track_id: int) -> float:
@@ -84,9 +146,7 @@ class MixerAPI:
         Returns:
             Volume level (0.0 - 1.0)
         """
-        result = self.bridge.safe_execute(
-            f"mixer.getTrackVolume({track_id})"
-        )
+        result = self.bridge.safe_call(OpCode.GET_TRACK_VOLUME, track_id)
         if result.get("success"):
             return float(result.get("data", 0.8))
         return 0.8
@@ -102,11 +162,31 @@ class MixerAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"mixer.setTrackVolume({track_id}, {volume})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_TRACK_VOLUME, track_id, volume)
         return result.get("success", False)
 
+    def set_volume_and_describe(self, track_id: int, volume: float) -> Tuple[bool, str]:
+        """
+        Set the volume of a mixer track and get its name in one round-trip.
+
+        Args:
+            track_id: Mixer track index
+            volume: Volume level (0.0 - 1.0)
+
+        Returns:
+            Tuple of (success, track name)
+        """
+        result = self.bridge.safe_eval_tuple(
+            f"(mixer.setTrackVolume({track_id}, {volume}), mixer.getTrackName({track_id}))",
+            2,
+        )
+        if not result.get("success"):
+            return False, f"Track {track_id}"
+
+        name = str(result["data"][1])
+        self._cache.set((track_id, "name"), {"success": True, "data": name})
+        return True, name
+
     def get_pan(self, track_id: int) -> float:
         """
         Get the pan of a mixer track.
@@ -117,9 +197,7 @@ class MixerAPI:
         Returns:
             Pan value (-1.0 = left, 0.0 = center, 1.0 = right)
         """
-        result = self.bridge.safe_execute(
-            f"mixer.getTrackPan({track_id})"
-        )
+        result = self.bridge.safe_call(OpCode.GET_TRACK_PAN, track_id)
         if result.get("success"):
             return float(result.get("data", 0.0))
         return 0.0
@@ -135,31 +213,92 @@ class MixerAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"mixer.setTrackPan({track_id}, {pan})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_TRACK_PAN, track_id, pan)
         return result.get("success", False)
 
-    def get_all_levels(self) -> List[Dict[str, Any]]:
+    def get_all_levels(self) -> List[MixerLevel]:
         """
         Get volume and pan levels for all mixer tracks.
 
         Returns:
-            List of mixer track information
+            List of mixer track levels
         """
-        track_count = self.get_track_count()
-        tracks = []
+        return self._get_level_rows(0, "mixer.trackCount()")
 
-        for i in range(track_count):
-            track_info = {
-                "track_id": i,
-                "name": self.get_track_name(i),
-                "volume": self.get_volume(i),
-                "pan": self.get_pan(i),
-            }
-            tracks.append(track_info)
+    def get_all_levels_columns(self) -> Dict[str, Any]:
+        """
+        Get volume and pan levels for all mixer tracks in column form.
+
+        Same data as get_all_levels(), as one column per field (row i of
+        every column describes track i) instead of one tuple per track.
+        Volumes and pans are contiguous float32 ``array.array`` buffers,
+        which can be wrapped without copying (``numpy.frombuffer(volumes,
+        "f4")``).
+
+        Returns:
+            Dictionary with "track_ids" and "names" lists, and "volumes"
+            and "pans" float arrays
+        """
+        result = self.bridge.safe_eval_tuple(
+            "(lambda count: ("
+            "[mixer.getTrackName(i) for i in range(count)], "
+            "[mixer.getTrackVolume(i) for i in range(count)], "
+            "[mixer.getTrackPan(i) for i in range(count)]"
+            "))(mixer.trackCount())",
+            3,
+        )
+
+        names, volumes, pans = [], [], []
+        if result.get("success"):
+            names, volumes, pans = result["data"]
+
+        return {
+            "track_ids": list(range(len(names))),
+            "names": [str(name) for name in names],
+            "volumes": array("f", volumes),
+            "pans": array("f", pans),
+        }
 
-        return tracks
+    def get_levels_range(self, start: int, count: int) -> List[MixerLevel]:
+        """
+        Get volume and pan levels for a range of mixer tracks.
+
+        Only the requested tracks are read and sent back, so showing the
+        first few tracks of a large mixer stays cheap.
+
+        Args:
+            start: Index of the first track (0 = Master)
+            count: Maximum number of tracks to return
+
+        Returns:
+            List of mixer track levels (shorter than count if the range
+            runs past the last track)
+        """
+        return self._get_level_rows(start, f"min({start + count}, mixer.trackCount())")
+
+    def _get_level_rows(self, start: int, stop: str) -> List[MixerLevel]:
+        """
+        Read track level rows from start up to a stop expression evaluated in FL Studio.
+
+        Args:
+            start: Index of the first track
+            stop: Expression for the index after the last track
+
+        Returns:
+            List of mixer track levels
+        """
+        # Build every row inside FL Studio so the whole scan is one round-trip
+        result = self.bridge.safe_execute_many(
+            "[(mixer.getTrackName(i), mixer.getTrackVolume(i), mixer.getTrackPan(i)) "
+            f"for i in range({start}, {stop})]"
+        )
+        if not result.get("success"):
+            return []
+
+        return [
+            MixerLevel(i, str(name), float(volume), float(pan))
+            for i, (name, volume, pan) in enumerate(result["data"], start)
+        ]
 
     def route_channel(self, channel_id: int, mixer_track_id: int) -> bool:
         """
@@ -172,8 +311,8 @@ class MixerAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"channels.routeToMixerTrack({channel_id}, {mixer_track_id})"
+        result = self.bridge.safe_call(
+            OpCode.ROUTE_TO_MIXER_TRACK, channel_id, mixer_track_id
         )
         return result.get("success", False)
 
@@ -187,13 +326,30 @@ class MixerAPI:
         Returns:
             Current level (0.0 - 1.0)
         """
-        result = self.bridge.safe_execute(
-            f"mixer.getTrackMeterLevel({track_id})"
-        )
+        result = self.bridge.safe_call(OpCode.GET_TRACK_METER_LEVEL, track_id)
         if result.get("success"):
             return float(result.get("data", 0.0))
         return 0.0
 
+    def get_all_meter_levels(self) -> array:
+        """
+        Get the current meter levels for all tracks in one round-trip.
+
+        The levels are returned as a contiguous float32 ``array.array``
+        indexed by track, so per-frame polling is a single request and the
+        result can be wrapped without copying (``numpy.frombuffer(levels,
+        "f4")``) for vectorized peak or threshold checks.
+
+        Returns:
+            Current level per track (0.0 - 1.0)
+        """
+        result = self.bridge.safe_execute_many(
+            "[mixer.getTrackMeterLevel(i) for i in range(mixer.trackCount())]"
+        )
+        if not result.get("success"):
+            return array("f")
+        return array("f", result["data"])
+
     def solo_track(self, track_id: int, solo: bool = True) -> bool:
         """
         Solo or unsolo a mixer track.
@@ -0,0 +1,229 @@
+"""
+FL Studio Project API wrapper.
+
+Provides project-wide reads that span transport, channels, and mixer.
+"""
+
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+from fl_studio_mcp.core.bridge import FLStudioBridge
+from fl_studio_mcp.core.exceptions import FLStudioAPIError
+
+# Project summary as one expression, so get_info is a single round-trip
+_INFO_CODE = (
+    "(transport.getTempo(), "
+    "channels.channelCount(), "
+    "mixer.trackCount(), "
+    "transport.isPlaying(), "
+    "transport.isRecording(), "
+    "transport.getSongPos())"
+)
+
+# Whole-project state as one expression, so a snapshot is a single round-trip.
+# {channel_stop}/{track_stop} bound how many channel and track rows are read.
+_SNAPSHOT_CODE = (
+    "(transport.getTempo(), "
+    "transport.isPlaying(), "
+    "transport.isRecording(), "
+    "transport.getSongPos(), "
+    "channels.selectedChannel(), "
+    "channels.channelCount(), "
+    "mixer.trackCount(), "
+    "[(channels.getChannelName(i), channels.getChannelColor(i)) "
+    "for i in range({channel_stop})], "
+    "[(mixer.getTrackName(i), mixer.getTrackVolume(i), mixer.getTrackPan(i)) "
+    "for i in range({track_stop})])"
+)
+
+
+class ProjectAPI:
+    """
+    Wrapper for project-wide FL Studio reads.
+
+    Combines transport, channel, and mixer state into single requests
+    so callers can inspect the whole project without one call per item.
+    """
+
+    def __init__(self, bridge: FLStudioBridge):
+        """
+        Initialize project API.
+
+        Args:
+            bridge: FLStudioBridge instance
+        """
+        self.bridge = bridge
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get tempo, channel/track counts, and transport status in one round-trip.
+
+        Returns:
+            Dictionary with project summary information
+        """
+        result = self.bridge.safe_eval_tuple(_INFO_CODE, 6)
+        if not result.get("success"):
+            return {
+                "tempo_bpm": 120.0,
+                "channel_count": 0,
+                "mixer_track_count": 0,
+                "transport": {"playing": False, "recording": False, "position_beats": 0.0},
+            }
+
+        tempo, channel_count, track_count, playing, recording, position = result["data"]
+
+        return {
+            "tempo_bpm": float(tempo),
+            "channel_count": int(channel_count),
+            "mixer_track_count": int(track_count),
+            "transport": {
+                "playing": bool(playing),
+                "recording": bool(recording),
+                "position_beats": position,
+            },
+        }
+
+    def get_snapshot(
+        self,
+        max_channels: Optional[int] = None,
+        max_tracks: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get transport, channel, and mixer state in one round-trip.
+
+        Args:
+            max_channels: Only read the first N channels (all if None)
+            max_tracks: Only read the first N mixer tracks (all if None)
+
+        Returns:
+            Dictionary with tempo, transport status, channel/track counts,
+            channels, and mixer tracks
+
+        Raises:
+            FLStudioAPIError: If FL Studio could not be read
+        """
+        data = self._read_snapshot(max_channels, max_tracks)
+        selected, channel_rows, track_rows = data[4], data[7], data[8]
+
+        return {
+            **self._summarize(data),
+            "channels": [
+                {
+                    "id": i,
+                    "name": str(name),
+                    "color": f"#{color:06X}",
+                    "selected": i == selected,
+                }
+                for i, (name, color) in enumerate(channel_rows)
+            ],
+            "mixer_tracks": [
+                {
+                    "track_id": i,
+                    "name": str(name),
+                    "volume": float(volume),
+                    "pan": float(pan),
+                }
+                for i, (name, volume, pan) in enumerate(track_rows)
+            ],
+        }
+
+    def get_snapshot_columns(
+        self,
+        max_channels: Optional[int] = None,
+        max_tracks: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get transport, channel, and mixer state in one round-trip, in column form.
+
+        Same data as get_snapshot(), but "channels" and "mixer_tracks" hold
+        one column per field (index i of every column describes the same
+        item) instead of one dictionary per item. Mixer volumes and pans
+        are float32 ``array.array`` buffers.
+
+        Args:
+            max_channels: Only read the first N channels (all if None)
+            max_tracks: Only read the first N mixer tracks (all if None)
+
+        Returns:
+            Dictionary with tempo, transport status, channel/track counts,
+            channel columns ("ids", "names", "colors", "selected"), and
+            mixer track columns ("track_ids", "names", "volumes", "pans")
+
+        Raises:
+            FLStudioAPIError: If FL Studio could not be read
+        """
+        data = self._read_snapshot(max_channels, max_tracks)
+        selected, channel_rows, track_rows = data[4], data[7], data[8]
+
+        # Transpose the rows into columns
+        channel_names, channel_colors = (
+            zip(*channel_rows, strict=True) if channel_rows else ((), ())
+        )
+        track_names, volumes, pans = (
+            zip(*track_rows, strict=True) if track_rows else ((), (), ())
+        )
+
+        return {
+            **self._summarize(data),
+            "channels": {
+                "ids": list(range(len(channel_names))),
+                "names": [str(name) for name in channel_names],
+                "colors": [f"#{color:06X}" for color in channel_colors],
+                "selected": [i == selected for i in range(len(channel_names))],
+            },
+            "mixer_tracks": {
+                "track_ids": list(range(len(track_names))),
+                "names": [str(name) for name in track_names],
+                "volumes": array("f", volumes),
+                "pans": array("f", pans),
+            },
+        }
+
+    def _read_snapshot(
+        self,
+        max_channels: Optional[int],
+        max_tracks: Optional[int],
+    ) -> Tuple[Any, ...]:
+        """
+        Evaluate the snapshot expression in FL Studio.
+
+        Args:
+            max_channels: Only read the first N channels (all if None)
+            max_tracks: Only read the first N mixer tracks (all if None)
+
+        Returns:
+            The raw 9-item snapshot tuple
+
+        Raises:
+            FLStudioAPIError: If FL Studio could not be read
+        """
+        code = _SNAPSHOT_CODE.format(
+            channel_stop=(
+                "channels.channelCount()" if max_channels is None
+                else f"min({max_channels}, channels.channelCount())"
+            ),
+            track_stop=(
+                "mixer.trackCount()" if max_tracks is None
+                else f"min({max_tracks}, mixer.trackCount())"
+            ),
+        )
+        result = self.bridge.safe_eval_tuple(code, 9)
+        if not result.get("success"):
+            raise FLStudioAPIError(result["error"], api_component="project")
+        return result["data"]
+
+    @staticmethod
+    def _summarize(data: Tuple[Any, ...]) -> Dict[str, Any]:
+        """Build the tempo, transport, and count fields of a snapshot."""
+        tempo, playing, recording, position, _, channel_count, track_count = data[:7]
+
+        return {
+            "tempo_bpm": float(tempo),
+            "transport": {
+                "playing": bool(playing),
+                "recording": bool(recording),
+                "position_beats": position,
+            },
+            "channel_count": int(channel_count),
+            "mixer_track_count": int(track_count),
+        }
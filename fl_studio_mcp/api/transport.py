@@ -4,10 +4,10 @@ FL Studio Transport API wrapper.
 Provides control over playback, recording, and transport functions.
 """
 
-from typing import Dict, Any
-
 from fl_studio_mcp.core.bridge import FLStudioBridge
 from fl_studio_mcp.core.exceptions import FLStudioMCPError
+from fl_studio_mcp.core.opcodes import OpCode
+from fl_studio_mcp.models.transport import TransportStatus
 
 
 class TransportAPI:
@@ -57,8 +57,10 @@ class TransportAPI:
         Returns:
             True if successful
         """
+        # transport.start() toggles playback, so while playing it pauses in
+        # place; when already stopped there is nothing to do
         result = self.bridge.safe_execute(
-            "transport.start() if transport.isPlaying() else transport.stop()"
+            "transport.isPlaying() and transport.start()"
         )
         return result.get("success", False)
 
@@ -102,30 +104,23 @@ class TransportAPI:
             return bool(result.get("data", False))
         return False
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> TransportStatus:
         """
         Get current transport status.
 
         Returns:
-            Dictionary with transport status information
+            Transport status (use ``_asdict()`` for a dictionary)
         """
-        is_playing = self.is_playing()
-        is_recording = self.is_recording()
-
-        # Get current position in beats
-        position_result = self.bridge.safe_execute(
-            "transport.getSongPos()"
+        result = self.bridge.safe_eval_tuple(
+            "(transport.isPlaying(), transport.isRecording(), transport.getSongPos())",
+            3,
         )
 
-        position = 0.0
-        if position_result.get("success"):
-            position = position_result.get("data", 0)
+        is_playing, is_recording, position = False, False, 0.0
+        if result.get("success"):
+            is_playing, is_recording, position = result["data"]
 
-        return {
-            "playing": is_playing,
-            "recording": is_recording,
-            "position_beats": position,
-        }
+        return TransportStatus(bool(is_playing), bool(is_recording), position)
 
     def jump_to(self, position: float) -> bool:
         """
@@ -137,9 +132,7 @@ class TransportAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"transport.setSongPos({position})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_SONG_POS, position)
         return result.get("success", False)
 
     def set_loop_mode(self, enabled: bool) -> bool:
@@ -152,9 +145,7 @@ class TransportAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"transport.setLoopMode({1 if enabled else 0})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_LOOP_MODE, 1 if enabled else 0)
         return result.get("success", False)
 
     def get_loop_mode(self) -> bool:
@@ -181,9 +172,7 @@ class TransportAPI:
         Returns:
             True if successful
         """
-        result = self.bridge.safe_execute(
-            f"transport.setTempo({bpm})"
-        )
+        result = self.bridge.safe_call(OpCode.SET_TEMPO, bpm)
         return result.get("success", False)
 
     def get_tempo(self) -> float:
@@ -4,16 +4,21 @@ Flapi bridge wrapper for communicating with FL Studio.
 This module provides a bridge between the MCP server and FL Studio via Flapi.
 """
 
+import importlib
 import logging
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Callable, Optional
 
 from fl_studio_mcp.core.exceptions import (
     FlapiNotFoundError,
+    FLStudioMCPError,
     FLStudioConnectionError,
     FLStudioNotConnectedError,
     FLStudioAPIError,
     MIDIPortNotFoundError,
 )
+from fl_studio_mcp.core.opcodes import OpCode
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +34,37 @@ class FLStudioBridge:
     def __init__(self):
         self._connected = False
         self._flapi = None
-        self._attempted_import = False
+        self._enable: Optional[Callable[[], Any]] = None
+        self._disable: Optional[Callable[[], Any]] = None
+        self._eval: Optional[Callable[[str], Any]] = None
+        # Protocol-level ping: hello() in Flapi 1.x, heartbeat() in 0.2
+        self._heartbeat: Optional[Callable[[], Any]] = None
+        # Connection info that only changes when Flapi is (re)imported
+        self._info_cache: dict[str, Any] = {"flapi_available": False, "flapi_version": None}
+        self._dispatch: dict[OpCode, Callable[..., Any]] = {}
+        # time.monotonic() of the last successful round-trip (0.0 = unknown)
+        self._last_alive = 0.0
+        # Flapi talks over a single pair of MIDI ports, so requests coming
+        # from worker threads must not interleave
+        self._lock = threading.RLock()
 
     def _ensure_flapi(self) -> None:
         """Ensure Flapi is imported and available."""
-        if self._attempted_import:
+        if self._flapi is not None:
             return
 
         try:
             import flapi
 
             self._flapi = flapi
-            self._attempted_import = True
+            self._enable = flapi.enable
+            self._disable = flapi.disable
+            self._eval = flapi.fl_eval
+            self._heartbeat = getattr(flapi, "hello", None) or getattr(flapi, "heartbeat", None)
+            self._info_cache = {
+                "flapi_available": True,
+                "flapi_version": self._get_flapi_version(),
+            }
             logger.info("Flapi imported successfully")
         except ImportError as e:
             raise FlapiNotFoundError(
@@ -70,7 +94,7 @@ class FLStudioBridge:
 
         try:
             # Enable Flapi connection
-            self._flapi.enable()
+            self._enable()
             self._connected = True
             logger.info(f"Connected to FL Studio (request={request_port}, response={response_port})")
             return True
@@ -84,12 +108,14 @@ class FLStudioBridge:
         """Disconnect from FL Studio."""
         if self._connected:
             try:
-                if self._flapi:
-                    self._flapi.disable()
+                if self._disable:
+                    self._disable()
             except Exception as e:
                 logger.warning(f"Error during disconnect: {e}")
             finally:
                 self._connected = False
+                self._last_alive = 0.0
+                self._dispatch.clear()
                 logger.info("Disconnected from FL Studio")
 
     @property
@@ -97,6 +123,15 @@ class FLStudioBridge:
         """Check if currently connected to FL Studio."""
         return self._connected
 
+    @property
+    def last_alive(self) -> float:
+        """
+        time.monotonic() of the last successful request to FL Studio.
+
+        Reset to 0.0 when a request fails or the bridge disconnects.
+        """
+        return self._last_alive
+
     def execute(self, code: str) -> Any:
         """
         Execute Python code in FL Studio.
@@ -117,17 +152,53 @@ class FLStudioBridge:
             )
 
         try:
-            # Execute the code via Flapi
-            result = eval(code)
-            logger.debug(f"Executed code: {code[:50]}...")
+            # Evaluate the whole expression inside FL Studio, so it costs a
+            # single round-trip however many FL Studio calls it makes
+            with self._lock:
+                result = self._eval(code)
+            self._last_alive = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executed code: %s...", code[:50])
             return result
         except Exception as e:
-            logger.error(f"Error executing code: {e}")
+            self._last_alive = 0.0
+            logger.error("Error executing code: %s", e)
             raise FLStudioAPIError(
                 f"Failed to execute code in FL Studio: {str(e)}",
                 api_component="executor"
             ) from e
 
+    def ping(self) -> bool:
+        """
+        Check that FL Studio answers requests.
+
+        Sends Flapi's own heartbeat message, which FL Studio answers
+        without running any FL Studio API code. Flapi versions without a
+        heartbeat fall back to the cheapest native call through the opcode
+        dispatcher. Either way this costs a single small round-trip.
+
+        Returns:
+            True if FL Studio responded
+        """
+        if not self._connected:
+            return False
+
+        if self._heartbeat is None:
+            try:
+                self.call(OpCode.IS_PLAYING)
+                return True
+            except FLStudioMCPError:
+                return False
+
+        try:
+            with self._lock:
+                alive = bool(self._heartbeat())
+        except Exception as e:
+            logger.warning("Flapi heartbeat failed: %s", e)
+            alive = False
+        self._last_alive = time.monotonic() if alive else 0.0
+        return alive
+
     def safe_execute(self, code: str) -> dict:
         """
         Execute code with error handling.
@@ -146,6 +217,123 @@ class FLStudioBridge:
         except Exception as e:
             return {"success": False, "error": str(e), "type": "unexpected_error"}
 
+    def _resolve(self, op: OpCode) -> Callable[..., Any]:
+        """Look up the FL Studio function for an opcode, caching the result."""
+        func = self._dispatch.get(op)
+        if func is None:
+            module_name, _, func_name = op.value.partition(".")
+            func = getattr(importlib.import_module(module_name), func_name)
+            self._dispatch[op] = func
+        return func
+
+    def call(self, op: OpCode, *args: Any) -> Any:
+        """
+        Call an FL Studio API function directly.
+
+        Unlike execute(), no code string is built or evaluated: the opcode
+        is mapped to its function once and then called with the arguments.
+
+        Args:
+            op: Operation to perform
+            *args: Arguments for the FL Studio function
+
+        Returns:
+            Result of the call
+
+        Raises:
+            FLStudioNotConnectedError: If not connected
+            FLStudioAPIError: If the call fails
+        """
+        if not self._connected:
+            raise FLStudioNotConnectedError(
+                "Not connected to FL Studio. Call connect() first."
+            )
+
+        try:
+            with self._lock:
+                result = self._resolve(op)(*args)
+            self._last_alive = time.monotonic()
+            return result
+        except Exception as e:
+            self._last_alive = 0.0
+            logger.error("Error calling %s: %s", op.value, e)
+            raise FLStudioAPIError(
+                f"Failed to call {op.value} in FL Studio: {str(e)}",
+                api_component="dispatcher"
+            ) from e
+
+    def safe_call(self, op: OpCode, *args: Any) -> dict:
+        """
+        Call an FL Studio API function with error handling.
+
+        Args:
+            op: Operation to perform
+            *args: Arguments for the FL Studio function
+
+        Returns:
+            Dictionary with success status and data/error
+        """
+        try:
+            result = self.call(op, *args)
+            return {"success": True, "data": result}
+        except FLStudioMCPError as e:
+            return {"success": False, "error": str(e), "type": e.__class__.__name__}
+        except Exception as e:
+            return {"success": False, "error": str(e), "type": "unexpected_error"}
+
+    def safe_execute_many(self, code: str) -> dict:
+        """
+        Execute code that builds a sequence of results in a single round-trip.
+
+        The expression is evaluated inside FL Studio (see execute()), so
+        it costs one MIDI round-trip however many FL Studio calls it makes.
+        Bulk getters should build their whole result inside one expression
+        (e.g. a list comprehension) instead of issuing one call per item,
+        since every call() or execute() is a round-trip of its own.
+
+        Args:
+            code: Python expression evaluating to a list or tuple
+
+        Returns:
+            Dictionary with success status and data (as a list)/error
+        """
+        result = self.safe_execute(code)
+        if not result.get("success"):
+            return result
+
+        data = result.get("data")
+        if not isinstance(data, (list, tuple)):
+            return {
+                "success": False,
+                "error": f"Expected a sequence result, got {type(data).__name__}",
+                "type": "unexpected_result",
+            }
+        return {"success": True, "data": list(data)}
+
+    def safe_eval_tuple(self, code: str, length: int) -> dict:
+        """
+        Execute a tuple expression and check the shape of its result.
+
+        Args:
+            code: Python expression evaluating to a tuple
+            length: Expected number of items
+
+        Returns:
+            Dictionary with success status and data (a tuple)/error
+        """
+        result = self.safe_execute(code)
+        if not result.get("success"):
+            return result
+
+        data = result.get("data")
+        if not isinstance(data, tuple) or len(data) != length:
+            return {
+                "success": False,
+                "error": f"Expected a tuple of {length} items, got {data!r}",
+                "type": "unexpected_result",
+            }
+        return result
+
     def get_connection_info(self) -> dict:
         """
         Get information about the current connection.
@@ -153,19 +341,13 @@ class FLStudioBridge:
         Returns:
             Dictionary with connection status and info
         """
-        return {
-            "connected": self._connected,
-            "flapi_available": self._attempted_import,
-            "flapi_version": self._get_flapi_version() if self._flapi else None,
-        }
+        return {"connected": self._connected, **self._info_cache}
 
     def _get_flapi_version(self) -> Optional[str]:
         """Get Flapi version if available."""
-        try:
-            import flapi
-            return getattr(flapi, "__version__", "unknown")
-        except:
+        if self._flapi is None:
             return None
+        return getattr(self._flapi, "__version__", "unknown")
 
 
 # Global bridge instance
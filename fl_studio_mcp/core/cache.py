@@ -0,0 +1,88 @@
+"""
+Client-side caching for values read from FL Studio.
+
+Every read from FL Studio is a MIDI round-trip, so values that rarely
+change (names, colors) are kept locally for a short time.
+"""
+
+import time
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Dictionary cache whose entries expire after a fixed time-to-live.
+
+    Entries can also be dropped explicitly when the caller knows the
+    underlying value has changed.
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time-to-live for entries, in seconds
+        """
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value, or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            # pop() rather than del: another thread may have dropped it already
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live for this entry, in seconds (cache default if None)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Drop a single cached entry, if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            predicate: Drop only keys for which this returns True
+                (drops everything if None)
+        """
+        if predicate is None:
+            self._entries.clear()
+            return
+
+        # Iterate over a copy of the keys so a concurrent set() cannot
+        # change the dict mid-iteration
+        for key in [key for key in list(self._entries) if predicate(key)]:
+            self._entries.pop(key, None)
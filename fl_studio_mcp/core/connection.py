@@ -6,14 +6,23 @@ This module handles connection lifecycle and configuration.
 
 import logging
 import os
-from typing import Optional
+import time
+from typing import Any, Callable, Optional
 
 from dotenv import load_dotenv
 
 from fl_studio_mcp.core.bridge import FLStudioBridge
+from fl_studio_mcp.core.cache import TTLCache
+from fl_studio_mcp.core.exceptions import FLStudioConnectionError
+from fl_studio_mcp.models.connection import ConnectionState
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# A connection that answered a request this recently is not pinged by health_check()
+ALIVE_WINDOW_MS = 2000
+
 # Load environment variables
 load_dotenv()
 
@@ -35,45 +44,95 @@ class ConnectionManager:
         """
         self.bridge = bridge or FLStudioBridge()
         self._auto_connect = os.getenv("FL_AUTO_CONNECT", "false").lower() == "true"
+        self._request_port = os.getenv("FLAPI_REQUEST_PORT", "Flapi Request")
+        self._response_port = os.getenv("FLAPI_RESPONSE_PORT", "Flapi Response")
+        self._cache = TTLCache(ttl=0.5)
 
     def get_midi_port_names(self) -> tuple[str, str]:
         """
         Get MIDI port names from environment or defaults.
 
+        The environment is read once, when the manager is created.
+
         Returns:
             Tuple of (request_port, response_port)
         """
-        request_port = os.getenv("FLAPI_REQUEST_PORT", "Flapi Request")
-        response_port = os.getenv("FLAPI_RESPONSE_PORT", "Flapi Response")
-        return request_port, response_port
+        return self._request_port, self._response_port
 
-    def connect(self) -> bool:
+    def connect(self) -> ConnectionState:
         """
         Establish connection to FL Studio.
 
+        The returned state includes the connection status, so callers need
+        no further request to report it.
+
         Returns:
-            True if connection successful
+            Connection state (truthy if connection successful)
 
         Raises:
             FLStudioConnectionError: If connection fails
         """
         if self.bridge.is_connected:
             logger.info("Already connected to FL Studio")
-            return True
+        else:
+            request_port, response_port = self.get_midi_port_names()
 
-        request_port, response_port = self.get_midi_port_names()
+            logger.info(f"Connecting to FL Studio (ports: {request_port}, {response_port})")
+            self.bridge.connect(request_port, response_port)
 
-        logger.info(f"Connecting to FL Studio (ports: {request_port}, {response_port})")
-        return self.bridge.connect(request_port, response_port)
+        return ConnectionState(
+            connected=self.bridge.is_connected,
+            status=self.get_connection_status(),
+        )
 
     def disconnect(self) -> None:
         """Close connection to FL Studio."""
+        self._cache.invalidate()
         self.bridge.disconnect()
 
+    def cached(self, key: str, ttl_ms: int, fn: Callable[[], Any]) -> Any:
+        """
+        Get a value from the short-lived cache, computing it on a miss.
+
+        Used for reads such as channel/track counts that tools need on
+        every call but that only change on structural project edits.
+
+        Args:
+            key: Cache key (e.g. "channel_count")
+            ttl_ms: How long to keep the value, in milliseconds
+            fn: Function that reads the value from FL Studio
+
+        Returns:
+            Cached or freshly read value
+        """
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = fn()
+            self._cache.set(key, value, ttl=ttl_ms / 1000.0)
+        return value
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached values.
+
+        Call this after any operation that changes the cached value, e.g.
+        invalidate("channel_count") after adding or removing a channel.
+
+        Args:
+            key: Cache key to drop (drops everything if None)
+        """
+        if key is None:
+            self._cache.invalidate()
+        else:
+            self._cache.invalidate(lambda cached_key: cached_key == key)
+
     def ensure_connected(self) -> None:
         """
         Ensure connection is active, connect if needed.
 
+        Only the local connection flag is checked, so this costs no
+        round-trip; requests that fail report their own errors.
+
         Raises:
             FLStudioConnectionError: If connection fails
         """
@@ -106,20 +165,27 @@ class ConnectionManager:
 
         return status
 
-    def health_check(self) -> bool:
+    def health_check(self, max_age_ms: int = ALIVE_WINDOW_MS) -> bool:
         """
         Check if connection is healthy.
 
+        Any successful request counts as proof of health, so FL Studio is
+        only pinged when nothing has answered within max_age_ms.
+
+        Args:
+            max_age_ms: How recent a successful request must be to skip
+                the ping, in milliseconds (0 always pings)
+
         Returns:
             True if connection is healthy
         """
         if not self.bridge.is_connected:
             return False
 
-        try:
-            # Try to execute a simple command
-            result = self.bridge.safe_execute("1 + 1")
-            return result.get("success", False)
-        except Exception as e:
-            logger.warning(f"Health check failed: {e}")
+        if (time.monotonic() - self.bridge.last_alive) * 1000 < max_age_ms:
+            return True
+
+        if not self.bridge.ping():
+            logger.warning("Health check failed: FL Studio did not respond to ping")
             return False
+        return True
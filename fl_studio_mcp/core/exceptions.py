@@ -4,24 +4,38 @@
 class FLStudioMCPError(Exception):
     """Base exception for FL Studio MCP errors."""
 
-    pass
+    # Subclasses declare their fields as slots so that raising them does
+    # not allocate a per-instance __dict__
+    __slots__ = ()
+
+    def __reduce__(self):
+        # BaseException.__reduce__ only carries args and __dict__, so add the
+        # slot fields to keep them across pickle and copy
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), self.args, state or None
 
 
 class FLStudioConnectionError(FLStudioMCPError):
     """Raised when connection to FL Studio fails."""
 
-    pass
+    __slots__ = ()
 
 
 class FLStudioNotConnectedError(FLStudioMCPError):
     """Raised when attempting an operation while not connected to FL Studio."""
 
-    pass
+    __slots__ = ()
 
 
 class FLStudioAPIError(FLStudioMCPError):
     """Raised when FL Studio API returns an error."""
 
+    __slots__ = ("api_component",)
+
     def __init__(self, message: str, api_component: str = None):
         super().__init__(message)
         self.api_component = api_component
@@ -30,6 +44,8 @@ class FLStudioAPIError(FLStudioMCPError):
 class InvalidParameterError(FLStudioMCPError):
     """Raised when an invalid parameter is provided."""
 
+    __slots__ = ("parameter_name", "parameter_value")
+
     def __init__(self, message: str, parameter_name: str = None, parameter_value: any = None):
         super().__init__(message)
         self.parameter_name = parameter_name
@@ -39,12 +55,14 @@ class InvalidParameterError(FLStudioMCPError):
 class FlapiNotFoundError(FLStudioMCPError):
     """Raised when Flapi is not installed or not available."""
 
-    pass
+    __slots__ = ()
 
 
 class MIDIPortNotFoundError(FLStudioMCPError):
     """Raised when required MIDI ports are not found."""
 
+    __slots__ = ("port_name",)
+
     def __init__(self, message: str, port_name: str = None):
         super().__init__(message)
         self.port_name = port_name
@@ -0,0 +1,34 @@
+"""
+Operation codes for direct FL Studio API calls.
+
+Each opcode names an FL Studio API function. Calls made through
+FLStudioBridge.call() are dispatched straight to that function with their
+arguments, so no code string is built, compiled, or evaluated per call.
+"""
+
+from enum import Enum
+
+
+class OpCode(str, Enum):
+    """FL Studio API functions callable through FLStudioBridge.call()."""
+
+    # Transport
+    IS_PLAYING = "transport.isPlaying"
+    SET_SONG_POS = "transport.setSongPos"
+    SET_LOOP_MODE = "transport.setLoopMode"
+    SET_TEMPO = "transport.setTempo"
+
+    # Channels
+    SET_CHANNEL_NAME = "channels.setChannelName"
+    SET_CHANNEL_COLOR = "channels.setChannelColor"
+    SELECT_CHANNEL = "channels.selectChannel"
+    ADD_NOTE = "channels.addNote"
+    ROUTE_TO_MIXER_TRACK = "channels.routeToMixerTrack"
+
+    # Mixer
+    SET_TRACK_NAME = "mixer.setTrackName"
+    GET_TRACK_VOLUME = "mixer.getTrackVolume"
+    SET_TRACK_VOLUME = "mixer.setTrackVolume"
+    GET_TRACK_PAN = "mixer.getTrackPan"
+    SET_TRACK_PAN = "mixer.setTrackPan"
+    GET_TRACK_METER_LEVEL = "mixer.getTrackMeterLevel"
@@ -5,17 +5,20 @@ This is the main MCP server that exposes tools for controlling FL Studio.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
 from fl_studio_mcp.core.bridge import get_bridge
 from fl_studio_mcp.core.connection import ConnectionManager
+from fl_studio_mcp.core.exceptions import InvalidParameterError
 from fl_studio_mcp.api.transport import TransportAPI
 from fl_studio_mcp.api.channels import ChannelAPI
 from fl_studio_mcp.api.mixer import MixerAPI
+from fl_studio_mcp.api.project import ProjectAPI
 from fl_studio_mcp.utils.validation import (
     validate_tempo,
     validate_channel_id,
@@ -34,6 +37,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# How long channel/track counts used for ID validation are reused
+COUNT_CACHE_TTL_MS = 500
+
 # Create MCP server
 mcp = FastMCP("fl-studio-server")
 
@@ -43,6 +49,37 @@ connection_manager = ConnectionManager(bridge)
 transport_api = TransportAPI(bridge)
 channel_api = ChannelAPI(bridge)
 mixer_api = MixerAPI(bridge)
+project_api = ProjectAPI(bridge)
+
+
+def _tool(
+    fn: Callable[..., Awaitable[dict[str, Any]]]
+) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Turn exceptions raised by a tool into an error response.
+
+    Tool bodies only implement the happy path; invalid parameters and
+    unexpected errors are reported to the client as {"success": False}.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        try:
+            return await fn(*args, **kwargs)
+        except InvalidParameterError as e:
+            logger.warning(f"Invalid parameter for {fn.__name__}: {e}")
+            return {
+                "success": False,
+                "message": f"Invalid parameter: {str(e)}",
+                "parameter": e.parameter_name,
+            }
+        except Exception as e:
+            logger.error(f"Error in {fn.__name__}: {e}")
+            return {
+                "success": False,
+                "message": f"Error: {str(e)}",
+            }
+
+    return wrapper
 
 
 # ============================================================================
@@ -50,6 +87,7 @@ mixer_api = MixerAPI(bridge)
 # ============================================================================
 
 @mcp.tool()
+@_tool
 async def connect_to_fl_studio() -> dict[str, Any]:
     """
     Connect to FL Studio.
@@ -60,29 +98,22 @@ async def connect_to_fl_studio() -> dict[str, Any]:
     Returns:
         Connection status and information
     """
-    try:
-        success = connection_manager.connect()
-        if success:
-            status = connection_manager.get_connection_status()
-            return {
-                "success": True,
-                "message": "Successfully connected to FL Studio",
-                "connection_info": status,
-            }
-        else:
-            return {
-                "success": False,
-                "message": "Failed to connect to FL Studio",
-            }
-    except Exception as e:
-        logger.error(f"Error connecting to FL Studio: {e}")
+    state = await asyncio.to_thread(connection_manager.connect)
+    if state:
+        return {
+            "success": True,
+            "message": "Successfully connected to FL Studio",
+            "connection_info": state.status,
+        }
+    else:
         return {
             "success": False,
-            "message": f"Error: {str(e)}",
+            "message": "Failed to connect to FL Studio",
         }
 
 
 @mcp.tool()
+@_tool
 async def get_connection_status() -> dict[str, Any]:
     """
     Get current connection status.
@@ -92,18 +123,11 @@ async def get_connection_status() -> dict[str, Any]:
     Returns:
         Connection status information
     """
-    try:
-        status = connection_manager.get_connection_status()
-        return {
-            "success": True,
-            "status": status,
-        }
-    except Exception as e:
-        logger.error(f"Error getting connection status: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    status = connection_manager.get_connection_status()
+    return {
+        "success": True,
+        "status": status,
+    }
 
 
 # ============================================================================
@@ -111,6 +135,7 @@ async def get_connection_status() -> dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool
 async def transport_start() -> dict[str, Any]:
     """
     Start FL Studio playback.
@@ -120,23 +145,17 @@ async def transport_start() -> dict[str, Any]:
     Returns:
         Success status and message
     """
-    try:
-        connection_manager.ensure_connected()
-        success = transport_api.start()
+    await asyncio.to_thread(connection_manager.ensure_connected)
+    success = await asyncio.to_thread(transport_api.start)
 
-        return {
-            "success": success,
-            "message": "Playback started" if success else "Failed to start playback",
-        }
-    except Exception as e:
-        logger.error(f"Error starting playback: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": success,
+        "message": "Playback started" if success else "Failed to start playback",
+    }
 
 
 @mcp.tool()
+@_tool
 async def transport_stop() -> dict[str, Any]:
     """
     Stop FL Studio playback.
@@ -146,23 +165,17 @@ async def transport_stop() -> dict[str, Any]:
     Returns:
         Success status and message
     """
-    try:
-        connection_manager.ensure_connected()
-        success = transport_api.stop()
+    await asyncio.to_thread(connection_manager.ensure_connected)
+    success = await asyncio.to_thread(transport_api.stop)
 
-        return {
-            "success": success,
-            "message": "Playback stopped" if success else "Failed to stop playback",
-        }
-    except Exception as e:
-        logger.error(f"Error stopping playback: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": success,
+        "message": "Playback stopped" if success else "Failed to stop playback",
+    }
 
 
 @mcp.tool()
+@_tool
 async def get_transport_status() -> dict[str, Any]:
     """
     Get current transport status.
@@ -172,20 +185,13 @@ async def get_transport_status() -> dict[str, Any]:
     Returns:
         Transport status information including playing, recording, and position
     """
-    try:
-        connection_manager.ensure_connected()
-        status = transport_api.get_status()
+    await asyncio.to_thread(connection_manager.ensure_connected)
+    status = await asyncio.to_thread(transport_api.get_status)
 
-        return {
-            "success": True,
-            "status": status,
-        }
-    except Exception as e:
-        logger.error(f"Error getting transport status: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": True,
+        "status": status._asdict(),
+    }
 
 
 # ============================================================================
@@ -193,6 +199,7 @@ async def get_transport_status() -> dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool
 async def get_project_info() -> dict[str, Any]:
     """
     Get information about the current FL Studio project.
@@ -203,41 +210,42 @@ async def get_project_info() -> dict[str, Any]:
     Returns:
         Project information dictionary
     """
-    try:
-        connection_manager.ensure_connected()
+    await asyncio.to_thread(connection_manager.ensure_connected)
 
-        # Get tempo
-        tempo = transport_api.get_tempo()
+    # Tempo, counts, and transport status in a single request
+    project_info = await asyncio.to_thread(project_api.get_info)
 
-        # Get channel count
-        channel_count = channel_api.get_count()
+    return {
+        "success": True,
+        "project_info": project_info,
+    }
 
-        # Get mixer track count
-        mixer_track_count = mixer_api.get_track_count()
 
-        # Get transport status
-        transport_status = transport_api.get_status()
+@mcp.tool()
+@_tool
+async def get_project_snapshot() -> dict[str, Any]:
+    """
+    Get a snapshot of the whole FL Studio project.
 
-        project_info = {
-            "tempo_bpm": tempo,
-            "channel_count": channel_count,
-            "mixer_track_count": mixer_track_count,
-            "transport": transport_status,
-        }
+    Returns tempo, transport status, all channels, and all mixer tracks
+    from a single request. Prefer this over calling several getter tools
+    when you need an overview of the project.
 
-        return {
-            "success": True,
-            "project_info": project_info,
-        }
-    except Exception as e:
-        logger.error(f"Error getting project info: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    Returns:
+        Project snapshot dictionary
+    """
+    await asyncio.to_thread(connection_manager.ensure_connected)
+
+    snapshot = await asyncio.to_thread(project_api.get_snapshot)
+
+    return {
+        "success": True,
+        "snapshot": snapshot,
+    }
 
 
 @mcp.tool()
+@_tool
 async def set_tempo(bpm: float) -> dict[str, Any]:
     """
     Set the project tempo.
@@ -248,26 +256,19 @@ async def set_tempo(bpm: float) -> dict[str, Any]:
     Returns:
         Success status and new tempo
     """
-    try:
-        connection_manager.ensure_connected()
+    await asyncio.to_thread(connection_manager.ensure_connected)
 
-        # Validate tempo
-        validated_bpm = validate_tempo(bpm)
+    # Validate tempo
+    validated_bpm = validate_tempo(bpm)
 
-        # Set tempo
-        success = transport_api.set_tempo(validated_bpm)
+    # Set tempo
+    success = await asyncio.to_thread(transport_api.set_tempo, validated_bpm)
 
-        return {
-            "success": success,
-            "tempo_bpm": validated_bpm,
-            "message": f"Tempo set to {validated_bpm} BPM" if success else "Failed to set tempo",
-        }
-    except Exception as e:
-        logger.error(f"Error setting tempo: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": success,
+        "tempo_bpm": validated_bpm,
+        "message": f"Tempo set to {validated_bpm} BPM" if success else "Failed to set tempo",
+    }
 
 
 # ============================================================================
@@ -275,34 +276,54 @@ async def set_tempo(bpm: float) -> dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool
 async def get_channels() -> dict[str, Any]:
     """
     Get all channels in the project.
 
+    Returns channel names, colors, and selection status in column form:
+    "channels" holds parallel "ids", "names", "colors", and "selected"
+    lists, where index i of every list describes the same channel.
+    Use get_channels_rows for one object per channel.
+
+    Returns:
+        Column-form channel information
+    """
+    await asyncio.to_thread(connection_manager.ensure_connected)
+
+    channels = await asyncio.to_thread(channel_api.get_all_columns)
+
+    return {
+        "success": True,
+        "channels": channels,
+        "count": len(channels["ids"]),
+    }
+
+
+@mcp.tool()
+@_tool
+async def get_channels_rows() -> dict[str, Any]:
+    """
+    Get all channels in the project, one object per channel.
+
     Returns a list of all channels with their names, colors, and selection status.
 
     Returns:
         List of channel information
     """
-    try:
-        connection_manager.ensure_connected()
+    await asyncio.to_thread(connection_manager.ensure_connected)
 
-        channels = channel_api.get_all()
+    channels = await asyncio.to_thread(channel_api.get_all)
 
-        return {
-            "success": True,
-            "channels": channels,
-            "count": len(channels),
-        }
-    except Exception as e:
-        logger.error(f"Error getting channels: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": True,
+        "channels": channels,
+        "count": len(channels),
+    }
 
 
 @mcp.tool()
+@_tool
 async def select_channel(channel_id: int) -> dict[str, Any]:
     """
     Select a channel by ID.
@@ -313,30 +334,28 @@ async def select_channel(channel_id: int) -> dict[str, Any]:
     Returns:
         Success status and message
     """
-    try:
-        connection_manager.ensure_connected()
-
-        # Validate channel ID
-        max_channels = channel_api.get_count()
-        validated_id = validate_channel_id(channel_id, max_channels)
-
-        # Select channel
-        success = channel_api.select(validated_id)
-
-        channel_name = channel_api.get_name(validated_id)
-
-        return {
-            "success": success,
-            "channel_id": validated_id,
-            "channel_name": channel_name,
-            "message": f"Selected channel: {channel_name}" if success else "Failed to select channel",
-        }
-    except Exception as e:
-        logger.error(f"Error selecting channel: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    await asyncio.to_thread(connection_manager.ensure_connected)
+
+    # Validate channel ID
+    max_channels = await asyncio.to_thread(
+        connection_manager.cached,
+        "channel_count",
+        COUNT_CACHE_TTL_MS,
+        channel_api.get_count,
+    )
+    validated_id = validate_channel_id(channel_id, max_channels)
+
+    # Select channel (the name comes back in the same request)
+    success, channel_name = await asyncio.to_thread(
+        channel_api.select_and_describe, validated_id
+    )
+
+    return {
+        "success": success,
+        "channel_id": validated_id,
+        "channel_name": channel_name,
+        "message": f"Selected channel: {channel_name}" if success else "Failed to select channel",
+    }
 
 
 # ============================================================================
@@ -344,6 +363,7 @@ async def select_channel(channel_id: int) -> dict[str, Any]:
 # ============================================================================
 
 @mcp.tool()
+@_tool
 async def get_mixer_levels() -> dict[str, Any]:
     """
     Get volume and pan levels for all mixer tracks.
@@ -353,25 +373,19 @@ async def get_mixer_levels() -> dict[str, Any]:
     Returns:
         List of mixer track information with levels
     """
-    try:
-        connection_manager.ensure_connected()
+    await asyncio.to_thread(connection_manager.ensure_connected)
 
-        levels = mixer_api.get_all_levels()
+    levels = await asyncio.to_thread(mixer_api.get_all_levels)
 
-        return {
-            "success": True,
-            "tracks": levels,
-            "count": len(levels),
-        }
-    except Exception as e:
-        logger.error(f"Error getting mixer levels: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    return {
+        "success": True,
+        "tracks": [level._asdict() for level in levels],
+        "count": len(levels),
+    }
 
 
 @mcp.tool()
+@_tool
 async def set_mixer_fader(track_id: int, volume: float) -> dict[str, Any]:
     """
     Set the volume fader for a mixer track.
@@ -383,39 +397,102 @@ async def set_mixer_fader(track_id: int, volume: float) -> dict[str, Any]:
     Returns:
         Success status and new volume
     """
-    try:
-        connection_manager.ensure_connected()
+    await asyncio.to_thread(connection_manager.ensure_connected)
+
+    # Validate inputs
+    max_tracks = await asyncio.to_thread(
+        connection_manager.cached,
+        "mixer_track_count",
+        COUNT_CACHE_TTL_MS,
+        mixer_api.get_track_count,
+    )
+    validated_track_id = validate_mixer_track_id(track_id, max_tracks)
+    validated_volume = validate_volume(volume)
+
+    # Set volume (the track name comes back in the same request)
+    success, track_name = await asyncio.to_thread(
+        mixer_api.set_volume_and_describe, validated_track_id, validated_volume
+    )
+
+    return {
+        "success": success,
+        "track_id": validated_track_id,
+        "track_name": track_name,
+        "volume": validated_volume,
+        "message": f"Set {track_name} volume to {validated_volume:.2f}" if success else "Failed to set volume",
+    }
 
-        # Validate inputs
-        max_tracks = mixer_api.get_track_count()
-        validated_track_id = validate_mixer_track_id(track_id, max_tracks)
-        validated_volume = validate_volume(volume)
 
-        # Set volume
-        success = mixer_api.set_volume(validated_track_id, validated_volume)
+# ============================================================================
+# NOTE TOOLS (Basic Implementation)
+# ============================================================================
 
-        track_name = mixer_api.get_track_name(validated_track_id)
+class Note(BaseModel):
+    """A MIDI note passed to create_notes."""
 
-        return {
-            "success": success,
-            "track_id": validated_track_id,
-            "track_name": track_name,
-            "volume": validated_volume,
-            "message": f"Set {track_name} volume to {validated_volume:.2f}" if success else "Failed to set volume",
-        }
-    except Exception as e:
-        logger.error(f"Error setting mixer fader: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
+    position: float = Field(description="Position in beats (e.g., 0.0 for start)")
+    key: int = Field(description="MIDI key number (0-127, where 60 = C4)")
+    duration: float = Field(description="Note duration in beats")
+    velocity: int = Field(default=100, description="Note velocity (0-127, default 100)")
+
+
+async def _add_notes(
+    channel_id: int,
+    notes: list[Note]
+) -> tuple[bool, int, list[dict[str, Any]]]:
+    """
+    Validate notes and add them to a channel in a single request.
+
+    Args:
+        channel_id: Channel index
+        notes: Notes to add
+
+    Returns:
+        Tuple of (success, validated channel ID, validated notes)
+
+    Raises:
+        InvalidParameterError: If the channel or any note is invalid
+    """
+    if not notes:
+        raise InvalidParameterError(
+            "At least one note is required",
+            parameter_name="notes",
+            parameter_value=notes,
+        )
+
+    # Validate the whole batch before sending anything
+    max_channels = await asyncio.to_thread(
+        connection_manager.cached,
+        "channel_count",
+        COUNT_CACHE_TTL_MS,
+        channel_api.get_count,
+    )
+    validated_channel_id = validate_channel_id(channel_id, max_channels)
+    validated_notes = [
+        {
+            "position": validate_position(note.position),
+            "key": validate_midi_key(note.key),
+            "duration": validate_duration(note.duration),
+            "velocity": validate_velocity(note.velocity),
         }
+        for note in notes
+    ]
 
+    # Add all notes
+    success = await asyncio.to_thread(
+        channel_api.set_piano_roll_notes,
+        validated_channel_id,
+        [note["position"] for note in validated_notes],
+        [note["key"] for note in validated_notes],
+        [note["duration"] for note in validated_notes],
+        [note["velocity"] for note in validated_notes],
+    )
+
+    return success, validated_channel_id, validated_notes
 
-# ============================================================================
-# NOTE TOOLS (Basic Implementation)
-# ============================================================================
 
 @mcp.tool()
+@_tool
 async def create_note(
     channel_id: int,
     position: float,
@@ -427,6 +504,7 @@ async def create_note(
     Create a MIDI note in a channel.
 
     Adds a note to the piano roll for the specified channel.
+    Use create_notes to add several notes at once.
 
     Args:
         channel_id: Channel index
@@ -438,43 +516,49 @@ async def create_note(
     Returns:
         Success status and note information
     """
-    try:
-        connection_manager.ensure_connected()
-
-        # Validate inputs
-        max_channels = channel_api.get_count()
-        validated_channel_id = validate_channel_id(channel_id, max_channels)
-        validated_position = validate_position(position)
-        validated_key = validate_midi_key(key)
-        validated_duration = validate_duration(duration)
-        validated_velocity = validate_velocity(velocity)
-
-        # Add note
-        success = channel_api.set_piano_roll_note(
-            validated_channel_id,
-            validated_position,
-            validated_key,
-            validated_duration,
-            validated_velocity,
-        )
+    await asyncio.to_thread(connection_manager.ensure_connected)
 
-        return {
-            "success": success,
-            "note": {
-                "channel_id": validated_channel_id,
-                "position": validated_position,
-                "key": validated_key,
-                "duration": validated_duration,
-                "velocity": validated_velocity,
-            },
-            "message": "Note created successfully" if success else "Failed to create note",
-        }
-    except Exception as e:
-        logger.error(f"Error creating note: {e}")
-        return {
-            "success": False,
-            "message": f"Error: {str(e)}",
-        }
+    success, validated_channel_id, (note,) = await _add_notes(
+        channel_id,
+        [Note(position=position, key=key, duration=duration, velocity=velocity)],
+    )
+
+    return {
+        "success": success,
+        "note": {"channel_id": validated_channel_id, **note},
+        "message": "Note created successfully" if success else "Failed to create note",
+    }
+
+
+@mcp.tool()
+@_tool
+async def create_notes(channel_id: int, notes: list[Note]) -> dict[str, Any]:
+    """
+    Create several MIDI notes in a channel.
+
+    Adds all notes to the piano roll for the specified channel in a
+    single request. Prefer this over repeated create_note calls when
+    writing chords, arpeggios, or patterns.
+
+    Args:
+        channel_id: Channel index
+        notes: Notes to add, each with position, key, duration, and
+            optional velocity (default 100)
+
+    Returns:
+        Success status and note information
+    """
+    await asyncio.to_thread(connection_manager.ensure_connected)
+
+    success, validated_channel_id, validated_notes = await _add_notes(channel_id, notes)
+
+    return {
+        "success": success,
+        "channel_id": validated_channel_id,
+        "notes": validated_notes,
+        "count": len(validated_notes),
+        "message": f"Created {len(validated_notes)} notes" if success else "Failed to create notes",
+    }
 
 
 # ============================================================================
@@ -1 +1,11 @@
 """Data models for FL Studio MCP server."""
+
+from fl_studio_mcp.models.connection import ConnectionState
+from fl_studio_mcp.models.mixer import MixerLevel
+from fl_studio_mcp.models.transport import TransportStatus
+
+__all__ = [
+    "ConnectionState",
+    "MixerLevel",
+    "TransportStatus",
+]
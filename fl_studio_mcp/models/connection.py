@@ -0,0 +1,24 @@
+"""Connection state models."""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionState:
+    """
+    State of the FL Studio connection, as returned by ConnectionManager.connect().
+
+    Truthy when connected, so callers that treated connect() as returning
+    a bool keep working.
+
+    Attributes:
+        connected: Whether the bridge is connected
+        status: Connection status, as returned by get_connection_status()
+    """
+
+    connected: bool
+    status: dict[str, Any]
+
+    def __bool__(self) -> bool:
+        return self.connected
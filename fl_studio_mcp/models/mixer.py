@@ -0,0 +1,20 @@
+"""Mixer models."""
+
+from typing import NamedTuple
+
+
+class MixerLevel(NamedTuple):
+    """
+    Levels of one mixer track, as returned by MixerAPI.get_all_levels().
+
+    Attributes:
+        track_id: Mixer track index (0 = Master)
+        name: Track name
+        volume: Volume level (0.0 - 1.0)
+        pan: Pan position (-1.0 left to 1.0 right)
+    """
+
+    track_id: int
+    name: str
+    volume: float
+    pan: float
@@ -0,0 +1,18 @@
+"""Transport models."""
+
+from typing import NamedTuple
+
+
+class TransportStatus(NamedTuple):
+    """
+    Playback state, as returned by TransportAPI.get_status().
+
+    Attributes:
+        playing: Whether playback is running
+        recording: Whether recording is armed
+        position_beats: Song position in beats
+    """
+
+    playing: bool
+    recording: bool
+    position_beats: float
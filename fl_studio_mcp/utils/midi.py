@@ -4,12 +4,56 @@ MIDI utility functions for FL Studio MCP server.
 Provides helper functions for MIDI note conversions, frequencies, etc.
 """
 
-from typing import Dict, List, Tuple, Union
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from math import log2
+from typing import Dict, Tuple, Union
 
 
 # MIDI note names to note number mapping
 NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
+# Flat note names and their sharp equivalents
+FLAT_TO_SHARP = {"Db": "C#", "Eb": "D#", "Gb": "F#", "Ab": "G#", "Bb": "A#"}
+
+# Note name to index within the octave
+NOTE_INDEX = {name: index for index, name in enumerate(NOTE_NAMES)}
+
+# Note string such as "C4", "A#5", "Db3" or "C-1": (note name, octave)
+_NOTE_RE = re.compile(r"([A-G][#b]?)(-?\d+)")
+
+# Note name with octave and frequency (Hz) for every MIDI note number
+_MIDI_NAMES = tuple(f"{NOTE_NAMES[n % 12]}{n // 12 - 1}" for n in range(128))
+_MIDI_FREQ = tuple(440.0 * (2.0 ** ((n - 69) / 12.0)) for n in range(128))
+
+# Velocity thresholds and the dynamic marking below/above each one
+_VELOCITY_THRESHOLDS = (20, 40, 60, 80, 100)
+_VELOCITY_MARKS = ("pp", "p", "mp", "mf", "f", "ff")
+
+# Scale intervals (semitones from root)
+SCALES = {
+    "major": (0, 2, 4, 5, 7, 9, 11),
+    "minor": (0, 2, 3, 5, 7, 8, 10),
+    "pentatonic_major": (0, 2, 4, 7, 9),
+    "pentatonic_minor": (0, 3, 5, 7, 10),
+    "blues": (0, 3, 5, 6, 7, 10),
+    "chromatic": (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+}
+
+# Chord intervals (semitones from root)
+CHORDS = {
+    "major": (0, 4, 7),
+    "minor": (0, 3, 7),
+    "diminished": (0, 3, 6),
+    "augmented": (0, 4, 8),
+    "major_7th": (0, 4, 7, 11),
+    "minor_7th": (0, 3, 7, 10),
+    "dominant_7th": (0, 4, 7, 10),
+    "sus2": (0, 2, 7),
+    "sus4": (0, 5, 7),
+}
+
 
 def note_to_number(note: str, octave: int) -> int:
     """
@@ -32,15 +76,10 @@ def note_to_number(note: str, octave: int) -> int:
         69
     """
     # Handle flat notes (convert to sharp)
-    note = note.replace("Db", "C#")
-    note = note.replace("Eb", "D#")
-    note = note.replace("Gb", "F#")
-    note = note.replace("Ab", "G#")
-    note = note.replace("Bb", "A#")
-
-    try:
-        note_index = NOTE_NAMES.index(note)
-    except ValueError:
+    note = FLAT_TO_SHARP.get(note, note)
+
+    note_index = NOTE_INDEX.get(note)
+    if note_index is None:
         raise ValueError(
             f"Invalid note name: '{note}'. Must be one of {NOTE_NAMES}"
         )
@@ -78,10 +117,7 @@ def number_to_note(midi_number: int) -> str:
     if not (0 <= midi_number <= 127):
         raise ValueError(f"MIDI number must be 0-127, got {midi_number}")
 
-    note_index = midi_number % 12
-    octave = (midi_number // 12) - 1
-
-    return f"{NOTE_NAMES[note_index]}{octave}"
+    return _MIDI_NAMES[midi_number]
 
 
 def parse_note_string(note_str: str) -> int:
@@ -107,20 +143,13 @@ def parse_note_string(note_str: str) -> int:
     """
     note_str = note_str.strip()
 
-    # Find where the octave number starts
-    i = 0
-    while i < len(note_str) and not note_str[i].isdigit():
-        i += 1
-
-    if i == 0 or i == len(note_str):
+    match = _NOTE_RE.fullmatch(note_str)
+    if match is None:
         raise ValueError(
             f"Invalid note format: '{note_str}'. Expected format like 'C4' or 'A#5'"
         )
 
-    note_name = note_str[:i]
-    octave = int(note_str[i:])
-
-    return note_to_number(note_name, octave)
+    return note_to_number(match.group(1), int(match.group(2)))
 
 
 def midi_to_frequency(midi_number: int) -> float:
@@ -145,7 +174,7 @@ def midi_to_frequency(midi_number: int) -> float:
     if not (0 <= midi_number <= 127):
         raise ValueError(f"MIDI number must be 0-127, got {midi_number}")
 
-    return 440.0 * (2.0 ** ((midi_number - 69) / 12.0))
+    return _MIDI_FREQ[midi_number]
 
 
 def frequency_to_midi(frequency: float) -> int:
@@ -166,42 +195,33 @@ def frequency_to_midi(frequency: float) -> int:
         >>> frequency_to_midi(261.63)
         60
     """
-    import math
-
     if frequency <= 0:
         raise ValueError(f"Frequency must be positive, got {frequency}")
 
-    midi_number = round(12 * math.log2(frequency / 440.0) + 69)
+    midi_number = round(12 * log2(frequency / 440.0) + 69)
 
     # Clamp to valid range
     return max(0, min(127, midi_number))
 
 
-def get_scale_notes(root: str, scale_type: str = "major") -> List[int]:
+@lru_cache(maxsize=256)
+def get_scale_notes(root: str, scale_type: str = "major") -> Tuple[int, ...]:
     """
     Get MIDI note numbers for a scale.
 
+    Results are cached, so repeated lookups of the same scale are cheap.
+
     Args:
         root: Root note (e.g., "C4", "A#3")
         scale_type: Type of scale ("major", "minor", "pentatonic_major", etc.)
 
     Returns:
-        List of MIDI note numbers in the scale
+        Tuple of MIDI note numbers in the scale
 
     Examples:
         >>> get_scale_notes("C4", "major")
-        [60, 62, 64, 65, 67, 69, 71]  # C major scale
+        (60, 62, 64, 65, 67, 69, 71)  # C major scale
     """
-    # Scale intervals (semitones from root)
-    SCALES = {
-        "major": [0, 2, 4, 5, 7, 9, 11],
-        "minor": [0, 2, 3, 5, 7, 8, 10],
-        "pentatonic_major": [0, 2, 4, 7, 9],
-        "pentatonic_minor": [0, 3, 5, 7, 10],
-        "blues": [0, 3, 5, 6, 7, 10],
-        "chromatic": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
-    }
-
     scale_type = scale_type.lower().replace(" ", "_")
 
     if scale_type not in SCALES:
@@ -213,39 +233,29 @@ def get_scale_notes(root: str, scale_type: str = "major") -> List[int]:
     intervals = SCALES[scale_type]
     root_midi = parse_note_string(root)
 
-    return [root_midi + interval for interval in intervals]
+    return tuple(root_midi + interval for interval in intervals)
 
 
-def get_chord_notes(root: str, chord_type: str = "major") -> List[int]:
+@lru_cache(maxsize=256)
+def get_chord_notes(root: str, chord_type: str = "major") -> Tuple[int, ...]:
     """
     Get MIDI note numbers for a chord.
 
+    Results are cached, so repeated lookups of the same chord are cheap.
+
     Args:
         root: Root note (e.g., "C4", "A#3")
         chord_type: Type of chord ("major", "minor", "diminished", etc.)
 
     Returns:
-        List of MIDI note numbers in the chord
+        Tuple of MIDI note numbers in the chord
 
     Examples:
         >>> get_chord_notes("C4", "major")
-        [60, 64, 67]  # C major chord (C-E-G)
+        (60, 64, 67)  # C major chord (C-E-G)
         >>> get_chord_notes("C4", "minor")
-        [60, 63, 67]  # C minor chord (C-Eb-G)
+        (60, 63, 67)  # C minor chord (C-Eb-G)
     """
-    # Chord intervals (semitones from root)
-    CHORDS = {
-        "major": [0, 4, 7],
-        "minor": [0, 3, 7],
-        "diminished": [0, 3, 6],
-        "augmented": [0, 4, 8],
-        "major_7th": [0, 4, 7, 11],
-        "minor_7th": [0, 3, 7, 10],
-        "dominant_7th": [0, 4, 7, 10],
-        "sus2": [0, 2, 7],
-        "sus4": [0, 5, 7],
-    }
-
     chord_type = chord_type.lower().replace(" ", "_")
 
     if chord_type not in CHORDS:
@@ -257,7 +267,7 @@ def get_chord_notes(root: str, chord_type: str = "major") -> List[int]:
     intervals = CHORDS[chord_type]
     root_midi = parse_note_string(root)
 
-    return [root_midi + interval for interval in intervals]
+    return tuple(root_midi + interval for interval in intervals)
 
 
 def velocity_to_string(velocity: int) -> str:
@@ -276,18 +286,7 @@ def velocity_to_string(velocity: int) -> str:
         >>> velocity_to_string(100)
         'mf'
     """
-    if velocity < 20:
-        return "pp"
-    elif velocity < 40:
-        return "p"
-    elif velocity < 60:
-        return "mp"
-    elif velocity < 80:
-        return "mf"
-    elif velocity < 100:
-        return "f"
-    else:
-        return "ff"
+    return _VELOCITY_MARKS[bisect_right(_VELOCITY_THRESHOLDS, velocity)]
 
 
 def validate_velocity(velocity: int) -> int:
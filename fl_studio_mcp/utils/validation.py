@@ -4,10 +4,87 @@ Validation utilities for FL Studio MCP server.
 Provides input validation functions for all parameters.
 """
 
-from typing import Tuple, Union
+import os
+import re
+from math import isfinite
+from typing import Any, Tuple, Union
 
 from fl_studio_mcp.core.exceptions import InvalidParameterError
 
+# Six hex digits, e.g. "FF5733"
+_HEX6_RE = re.compile(r"[0-9A-Fa-f]{6}")
+
+
+def _to_float(value: Any, parameter_name: str, label: str) -> float:
+    """
+    Convert a parameter to a finite float.
+
+    Floats (the common case for JSON tool arguments) are used as-is;
+    anything else goes through float().
+
+    Args:
+        value: Value to convert
+        parameter_name: Parameter name reported in errors
+        label: Human-readable parameter name for error messages
+
+    Returns:
+        Value as a float
+
+    Raises:
+        InvalidParameterError: If the value is not a finite number
+    """
+    if type(value) is float:
+        number = value
+    else:
+        try:
+            number = float(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise InvalidParameterError(
+                f"{label} must be a number, got {value}",
+                parameter_name=parameter_name,
+                parameter_value=value
+            ) from e
+
+    if not isfinite(number):
+        raise InvalidParameterError(
+            f"{label} must be a finite number, got {value}",
+            parameter_name=parameter_name,
+            parameter_value=value
+        )
+
+    return number
+
+
+def _to_int(value: Any, parameter_name: str, label: str) -> int:
+    """
+    Convert a parameter to an int.
+
+    Ints (the common case for JSON tool arguments) are used as-is;
+    anything else goes through int().
+
+    Args:
+        value: Value to convert
+        parameter_name: Parameter name reported in errors
+        label: Human-readable parameter name for error messages
+
+    Returns:
+        Value as an int
+
+    Raises:
+        InvalidParameterError: If the value is not an integer
+    """
+    if type(value) is int:
+        return value
+
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise InvalidParameterError(
+            f"{label} must be an integer, got {value}",
+            parameter_name=parameter_name,
+            parameter_value=value
+        ) from e
+
 
 def validate_tempo(bpm: float) -> float:
     """
@@ -25,14 +102,7 @@ def validate_tempo(bpm: float) -> float:
     MIN_TEMPO = 20.0
     MAX_TEMPO = 999.0
 
-    try:
-        bpm = float(bpm)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Tempo must be a number, got {bpm}",
-            parameter_name="tempo",
-            parameter_value=bpm
-        ) from e
+    bpm = _to_float(bpm, "tempo", "Tempo")
 
     if not (MIN_TEMPO <= bpm <= MAX_TEMPO):
         raise InvalidParameterError(
@@ -57,14 +127,7 @@ def validate_midi_key(key: int) -> int:
     Raises:
         InvalidParameterError: If key is out of range
     """
-    try:
-        key = int(key)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"MIDI key must be an integer, got {key}",
-            parameter_name="key",
-            parameter_value=key
-        ) from e
+    key = _to_int(key, "key", "MIDI key")
 
     if not (0 <= key <= 127):
         raise InvalidParameterError(
@@ -89,14 +152,7 @@ def validate_velocity(velocity: int) -> int:
     Raises:
         InvalidParameterError: If velocity is invalid
     """
-    try:
-        velocity = int(velocity)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Velocity must be an integer, got {velocity}",
-            parameter_name="velocity",
-            parameter_value=velocity
-        ) from e
+    velocity = _to_int(velocity, "velocity", "Velocity")
 
     if not (0 <= velocity <= 127):
         raise InvalidParameterError(
@@ -122,14 +178,7 @@ def validate_channel_id(channel_id: int, max_channels: int = 999) -> int:
     Raises:
         InvalidParameterError: If channel ID is invalid
     """
-    try:
-        channel_id = int(channel_id)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Channel ID must be an integer, got {channel_id}",
-            parameter_name="channel_id",
-            parameter_value=channel_id
-        ) from e
+    channel_id = _to_int(channel_id, "channel_id", "Channel ID")
 
     if not (0 <= channel_id <= max_channels):
         raise InvalidParameterError(
@@ -155,14 +204,7 @@ def validate_pattern_id(pattern_id: int, max_patterns: int = 999) -> int:
     Raises:
         InvalidParameterError: If pattern ID is invalid
     """
-    try:
-        pattern_id = int(pattern_id)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Pattern ID must be an integer, got {pattern_id}",
-            parameter_name="pattern_id",
-            parameter_value=pattern_id
-        ) from e
+    pattern_id = _to_int(pattern_id, "pattern_id", "Pattern ID")
 
     if not (0 <= pattern_id <= max_patterns):
         raise InvalidParameterError(
@@ -188,14 +230,7 @@ def validate_mixer_track_id(track_id: int, max_tracks: int = 999) -> int:
     Raises:
         InvalidParameterError: If track ID is invalid
     """
-    try:
-        track_id = int(track_id)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Mixer track ID must be an integer, got {track_id}",
-            parameter_name="track_id",
-            parameter_value=track_id
-        ) from e
+    track_id = _to_int(track_id, "track_id", "Mixer track ID")
 
     if not (0 <= track_id <= max_tracks):
         raise InvalidParameterError(
@@ -220,14 +255,7 @@ def validate_volume(volume: float) -> float:
     Raises:
         InvalidParameterError: If volume is invalid
     """
-    try:
-        volume = float(volume)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Volume must be a number, got {volume}",
-            parameter_name="volume",
-            parameter_value=volume
-        ) from e
+    volume = _to_float(volume, "volume", "Volume")
 
     if not (0.0 <= volume <= 1.0):
         raise InvalidParameterError(
@@ -252,14 +280,7 @@ def validate_pan(pan: float) -> float:
     Raises:
         InvalidParameterError: If pan is invalid
     """
-    try:
-        pan = float(pan)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Pan must be a number, got {pan}",
-            parameter_name="pan",
-            parameter_value=pan
-        ) from e
+    pan = _to_float(pan, "pan", "Pan")
 
     if not (-1.0 <= pan <= 1.0):
         raise InvalidParameterError(
@@ -284,14 +305,7 @@ def validate_position(position: float) -> float:
     Raises:
         InvalidParameterError: If position is invalid
     """
-    try:
-        position = float(position)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Position must be a number, got {position}",
-            parameter_name="position",
-            parameter_value=position
-        ) from e
+    position = _to_float(position, "position", "Position")
 
     if position < 0:
         raise InvalidParameterError(
@@ -316,14 +330,7 @@ def validate_duration(duration: float) -> float:
     Raises:
         InvalidParameterError: If duration is invalid
     """
-    try:
-        duration = float(duration)
-    except (TypeError, ValueError) as e:
-        raise InvalidParameterError(
-            f"Duration must be a number, got {duration}",
-            parameter_name="duration",
-            parameter_value=duration
-        ) from e
+    duration = _to_float(duration, "duration", "Duration")
 
     if duration <= 0:
         raise InvalidParameterError(
@@ -366,14 +373,12 @@ def validate_color(color: str) -> str:
             parameter_value=color
         )
 
-    try:
-        int(color, 16)
-    except ValueError as e:
+    if not _HEX6_RE.fullmatch(color):
         raise InvalidParameterError(
             f"Color must be a valid hex string, got '{color}'",
             parameter_name="color",
             parameter_value=color
-        ) from e
+        )
 
     return f"#{color}"
 
@@ -392,8 +397,6 @@ def validate_file_path(file_path: str, must_exist: bool = False) -> str:
     Raises:
         InvalidParameterError: If file path is invalid
     """
-    import os
-
     if not isinstance(file_path, str):
         raise InvalidParameterError(
             f"File path must be a string, got {type(file_path)}",
@@ -401,7 +404,8 @@ def validate_file_path(file_path: str, must_exist: bool = False) -> str:
             parameter_value=file_path
         )
 
-    file_path = os.path.expanduser(file_path)
+    if file_path.startswith("~"):
+        file_path = os.path.expanduser(file_path)
 
     if must_exist and not os.path.exists(file_path):
         raise InvalidParameterError(
@@ -4,153 +4,236 @@ Test script for FL Studio MCP connection.
 This script tests the connection to FL Studio and verifies basic functionality.
 """
 
+import os
 import sys
 import logging
+from functools import lru_cache
+from typing import Any, Callable
 
 # Add parent directory to path for imports
 sys.path.insert(0, ".")
 
 from fl_studio_mcp.core.bridge import get_bridge, FLStudioBridge
 from fl_studio_mcp.core.connection import ConnectionManager
-from fl_studio_mcp.api.transport import TransportAPI
-from fl_studio_mcp.api.channels import ChannelAPI
-from fl_studio_mcp.api.mixer import MixerAPI
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from fl_studio_mcp.api.project import ProjectAPI
+
+# Configure logging. The test reports its own progress, so only warnings
+# and errors are logged; FL_MCP_QUIET=1 turns logging off entirely.
+if os.getenv("FL_MCP_QUIET") == "1":
+    logging.getLogger().addHandler(logging.NullHandler())
+else:
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(levelname)s - %(message)s"
+    )
 logger = logging.getLogger(__name__)
 
+# Status prefixes (ASCII, so output works on any console encoding)
+OK = "[OK]"
+FAIL = "[FAIL]"
+
+
+@lru_cache(maxsize=1)
+def _apis() -> tuple[FLStudioBridge, ConnectionManager, ProjectAPI]:
+    """Create the bridge and APIs once, on first use."""
+    bridge = get_bridge()
+    return bridge, ConnectionManager(bridge), ProjectAPI(bridge)
+
+
+def _write(lines: list[str]) -> None:
+    """Write a block of output lines with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _format_status(status: dict) -> list[str]:
+    """Format the connection status (Test 3)."""
+    return [f"{OK} Connection status: {status}"]
+
+
+def _format_project_info(snapshot: dict) -> list[str]:
+    """Format tempo and channel/track counts (Test 4)."""
+    return [
+        f"{OK} Tempo: {snapshot['tempo_bpm']} BPM",
+        f"{OK} Channels: {snapshot['channel_count']}",
+        f"{OK} Mixer tracks: {snapshot['mixer_track_count']}",
+    ]
+
+
+def _format_channels(snapshot: dict) -> list[str]:
+    """Format the first channels of the snapshot (Test 5)."""
+    channels = snapshot["channels"]
+    channel_count = snapshot["channel_count"]
+    out = [f"{OK} Found {channel_count} channels:"]
+    out += [
+        f"  - {name} (ID: {channel_id})"
+        for name, channel_id in zip(channels["names"], channels["ids"], strict=True)
+    ]
+    if channel_count > len(channels["ids"]):
+        out.append(f"  ... and {channel_count - len(channels['ids'])} more")
+    return out
+
+
+def _format_transport(snapshot: dict) -> list[str]:
+    """Format the transport status (Test 6)."""
+    status = snapshot["transport"]
+    return [
+        f"{OK} Playing: {status['playing']}",
+        f"{OK} Recording: {status['recording']}",
+        f"{OK} Position: {status['position_beats']} beats",
+    ]
+
+
+def _format_mixer_levels(snapshot: dict) -> list[str]:
+    """Format the first mixer tracks of the snapshot (Test 7)."""
+    levels = snapshot["mixer_tracks"]
+    track_count = snapshot["mixer_track_count"]
+    out = [f"{OK} Found {track_count} mixer tracks:"]
+    out += [
+        f"  - {name}: Vol={volume:.2f}, Pan={pan:.2f}"
+        for name, volume, pan in zip(
+            levels["names"], levels["volumes"], levels["pans"], strict=True
+        )
+    ]
+    if track_count > len(levels["track_ids"]):
+        out.append(f"  ... and {track_count - len(levels['track_ids'])} more")
+    return out
+
+
+def _format_health(healthy: bool) -> list[str]:
+    """Format the health check result (Test 8)."""
+    if healthy:
+        return [f"{OK} Connection is healthy"]
+    return [f"{FAIL} Connection health check failed"]
+
+
+def _run_checks(
+    checks: list[tuple[str, Callable[[], Any], Callable[[Any], list[str]], str]]
+) -> None:
+    """
+    Run checks and write each one's output as a block.
+
+    The header is written before the check runs, so it shows while a
+    request is in flight and precedes any log lines the check emits.
+
+    Args:
+        checks: (header, check, formatter, failure message) for each check
+    """
+    for header, check, format_result, failure in checks:
+        _write([header])
+        try:
+            out = format_result(check())
+        except Exception as e:
+            out = [f"{FAIL} {failure}: {e}"]
+        out.append("")
+        _write(out)
+
 
 def test_connection():
     """Test connection to FL Studio."""
-    print("=" * 60)
-    print("FL Studio MCP Connection Test")
-    print("=" * 60)
-    print()
+    _write([
+        "=" * 60,
+        "FL Studio MCP Connection Test",
+        "=" * 60,
+        "",
+    ])
 
     # Initialize bridge and APIs
-    bridge = get_bridge()
-    connection_manager = ConnectionManager(bridge)
-    transport_api = TransportAPI(bridge)
-    channel_api = ChannelAPI(bridge)
-    mixer_api = MixerAPI(bridge)
+    bridge, connection_manager, project_api = _apis()
 
     # Test 1: Check Flapi availability
-    print("Test 1: Checking Flapi availability...")
+    out = ["Test 1: Checking Flapi availability..."]
     try:
         bridge._ensure_flapi()
-        print("[OK] Flapi is available")
+        out.append(f"{OK} Flapi is available")
     except Exception as e:
-        print(f"[FAIL] Flapi not available: {e}")
-        print()
-        print("Please install Flapi: pip install flapi")
+        out += [
+            f"{FAIL} Flapi not available: {e}",
+            "",
+            "Please install Flapi: pip install flapi",
+        ]
+        _write(out)
         return False
-    print()
+    out.append("")
+    _write(out)
 
     # Test 2: Connect to FL Studio
-    print("Test 2: Connecting to FL Studio...")
-    print("Make sure FL Studio is running and Flapi script is loaded.")
+    _write([
+        "Test 2: Connecting to FL Studio...",
+        "Make sure FL Studio is running and Flapi script is loaded.",
+    ])
     try:
-        success = connection_manager.connect()
-        if success:
-            print("[OK] Connected to FL Studio successfully")
+        state = connection_manager.connect()
+        if state:
+            out = [f"{OK} Connected to FL Studio successfully"]
         else:
-            print("[FAIL] Failed to connect to FL Studio")
+            _write([f"{FAIL} Failed to connect to FL Studio"])
             return False
     except Exception as e:
-        print(f"[FAIL] Connection error: {e}")
-        print()
-        print("Troubleshooting:")
-        print("1. Make sure FL Studio is running")
-        print("2. Run 'flapi install' to install the Flapi script")
-        print("3. Configure MIDI ports in FL Studio")
+        _write([
+            f"{FAIL} Connection error: {e}",
+            "",
+            "Troubleshooting:",
+            "1. Make sure FL Studio is running",
+            "2. Run 'flapi install' to install the Flapi script",
+            "3. Configure MIDI ports in FL Studio",
+        ])
         return False
-    print()
-
-    # Test 3: Get connection status
-    print("Test 3: Getting connection status...")
-    try:
-        status = connection_manager.get_connection_status()
-        print(f"[OK] Connection status: {status}")
-    except Exception as e:
-        print(f"[FAIL] Error getting status: {e}")
-    print()
-
-    # Test 4: Get project info
-    print("Test 4: Getting project information...")
-    try:
-        tempo = transport_api.get_tempo()
-        channel_count = channel_api.get_count()
-        mixer_count = mixer_api.get_track_count()
-
-        print(f"[OK] Tempo: {tempo} BPM")
-        print(f"[OK] Channels: {channel_count}")
-        print(f"[OK] Mixer tracks: {mixer_count}")
-    except Exception as e:
-        print(f"[FAIL] Error getting project info: {e}")
-    print()
-
-    # Test 5: Get channels
-    print("Test 5: Getting channel information...")
-    try:
-        channels = channel_api.get_all()
-        print(f"[OK] Found {len(channels)} channels:")
-        for channel in channels[:5]:  # Show first 5
-            print(f"  - {channel['name']} (ID: {channel['id']})")
-        if len(channels) > 5:
-            print(f"  ... and {len(channels) - 5} more")
-    except Exception as e:
-        print(f"[FAIL] Error getting channels: {e}")
-    print()
-
-    # Test 6: Get transport status
-    print("Test 6: Getting transport status...")
-    try:
-        status = transport_api.get_status()
-        print(f"[OK] Playing: {status['playing']}")
-        print(f"[OK] Recording: {status['recording']}")
-        print(f"[OK] Position: {status['position_beats']} beats")
-    except Exception as e:
-        print(f"[FAIL] Error getting transport status: {e}")
-    print()
-
-    # Test 7: Get mixer levels
-    print("Test 7: Getting mixer levels...")
-    try:
-        levels = mixer_api.get_all_levels()
-        print(f"[OK] Found {len(levels)} mixer tracks:")
-        for track in levels[:3]:  # Show first 3
-            print(f"  - {track['name']}: Vol={track['volume']:.2f}, Pan={track['pan']:.2f}")
-        if len(levels) > 3:
-            print(f"  ... and {len(levels) - 3} more")
-    except Exception as e:
-        print(f"[FAIL] Error getting mixer levels: {e}")
-    print()
-
-    # Test 8: Health check
-    print("Test 8: Health check...")
+    out.append("")
+    _write(out)
+
+    # Test 3: the connection status comes from the connect() result, so it
+    # needs no request
+    _run_checks([
+        ("Test 3: Getting connection status...",
+         lambda: state.status, _format_status,
+         "Error getting status"),
+    ])
+
+    # Tests 4-7 read from one project snapshot, fetched in a single round-trip.
+    # Only the channels and tracks that are printed are read.
     try:
-        healthy = connection_manager.health_check()
-        if healthy:
-            print("[OK] Connection is healthy")
-        else:
-            print("[FAIL] Connection health check failed")
+        snapshot = project_api.get_snapshot_columns(max_channels=5, max_tracks=3)
     except Exception as e:
-        print(f"[FAIL] Health check error: {e}")
-    print()
+        _write([
+            f"{FAIL} Error reading project snapshot: {e}",
+            "Tests 4-7: skipped",
+            "",
+        ])
+    else:
+        _run_checks([
+            ("Test 4: Getting project information...",
+             lambda: snapshot, _format_project_info,
+             "Error getting project info"),
+            ("Test 5: Getting channel information...",
+             lambda: snapshot, _format_channels,
+             "Error getting channels"),
+            ("Test 6: Getting transport status...",
+             lambda: snapshot, _format_transport,
+             "Error getting transport status"),
+            ("Test 7: Getting mixer levels...",
+             lambda: snapshot, _format_mixer_levels,
+             "Error getting mixer levels"),
+        ])
+
+    # Test 8
+    _run_checks([
+        ("Test 8: Health check...",
+         connection_manager.health_check, _format_health,
+         "Health check error"),
+    ])
+
+    _write(["Disconnecting..."])
 
     # Disconnect
-    print("Disconnecting...")
     connection_manager.disconnect()
-    print("[OK] Disconnected")
-    print()
-
-    print("=" * 60)
-    print("All tests completed!")
-    print("=" * 60)
+    _write([
+        f"{OK} Disconnected",
+        "",
+        "=" * 60,
+        "All tests completed!",
+        "=" * 60,
+    ])
     return True
 
 